@@ -117,6 +117,7 @@ def main(args: None | argparse.Namespace = None) -> None:
             baudrate=args.baudrate,
             timeout=args.timeout,
         )
+        _set_low_latency(connection)
         bootattrs = mcbf.get_boot_attrs(connection)
         total_bytes, chunks = mcbf.chunked(args.hexfile, bootattrs)
         _logger.info("Erasing program area...")
@@ -138,6 +139,31 @@ def main(args: None | argparse.Namespace = None) -> None:
         _logger.exception("An error occurred:")
 
 
+def _set_low_latency(connection: Serial) -> None:
+    """Enable low latency mode on the serial port, if possible.
+
+    Many USB-serial adapters buffer incoming data for several milliseconds before
+    passing it on. Since flashing consists of many small request-response exchanges,
+    this delay adds up. Linux lets us disable the buffering via the ASYNC_LOW_LATENCY
+    flag.
+
+    Parameters
+    ----------
+    connection : serial.Serial
+        Open serial connection.
+    """
+    try:
+        connection.set_low_latency_mode(True)
+    except (AttributeError, NotImplementedError, TypeError, ValueError) as exc:
+        # AttributeError: Not available on Windows.
+        # NotImplementedError: Not available on non-Linux POSIX.
+        # TypeError: Port is not backed by a file descriptor.
+        # ValueError: Driver does not support the ioctl.
+        _logger.debug(f"Could not enable low latency mode: {exc}")
+    else:
+        _logger.debug("Enabled low latency mode")
+
+
 def flash(
     connection: Serial,
     chunks: Iterator[mcbf.Chunk],
@@ -160,6 +186,10 @@ def flash(
     """
     written_bytes = 0
     start = time.time()
+    # Log level does not change while flashing, so check it once up front.
+    debug = _logger.isEnabledFor(logging.DEBUG)
+    # Only print progressbar if log level is exactly INFO, not higher or lower.
+    progressbar = _logger.isEnabledFor(logging.INFO) and not debug
 
     for chunk in chunks:
         mcbf.write_flash(connection, chunk)
@@ -168,15 +198,14 @@ def flash(
             mcbf.checksum(connection, chunk)
 
         written_bytes += len(chunk.data)
-        _logger.debug(
-            f"{written_bytes} bytes written of {total_bytes} "
-            f"({written_bytes / total_bytes * 100:.2f}%)",
-        )
-        # Only print progressbar if log level is exactly INFO, not higher or lower.
-        loglevel: int = _logger.isEnabledFor(logging.INFO)
-        loglevel += _logger.isEnabledFor(logging.DEBUG)
 
-        if loglevel == 1:
+        if debug:
+            _logger.debug(
+                f"{written_bytes} bytes written of {total_bytes} "
+                f"({written_bytes / total_bytes * 100:.2f}%)",
+            )
+
+        if progressbar:
             print_progress(written_bytes, total_bytes, time.time() - start)
 
 
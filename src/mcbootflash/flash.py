@@ -3,26 +3,6 @@
 from __future__ import annotations
 
 import logging
-import sys
-
-if sys.version_info >= (3, 12):
-    from itertools import batched
-else:  # pragma: no cover
-    from itertools import islice
-    from typing import Iterable, Iterator, TypeVar
-
-    T = TypeVar("T")
-
-    # fmt: off
-    def batched(iterable: Iterable[T], n: int) -> Iterator[tuple[T, ...]]:  # noqa: D103
-        # Backport of `batched` to python<3.12.
-        if n < 1:
-            raise ValueError("n must be at least one")  # noqa: TRY003,EM101
-        it = iter(iterable)
-        while batch := tuple(islice(it, n)):
-            yield batch
-    # fmt: on
-
 
 from mcbootflash.error import (
     BadAddress,
@@ -47,6 +27,31 @@ from mcbootflash.types import (
 
 _logger = logging.getLogger(__name__)
 _FLASH_UNLOCK_KEY = 0x00AA0055
+# Command codes packed once per chunk. Looking up an IntEnum member costs more than
+# packing the resulting value, so keep plain ints for the hot path.
+_WRITE_FLASH = int(CommandCode.WRITE_FLASH)
+_CALC_CHECKSUM = int(CommandCode.CALC_CHECKSUM)
+# These commands take no arguments, so their packets never change.
+_READ_VERSION_PACKET = bytes(Command(CommandCode.READ_VERSION))
+_GET_MEMORY_ADDRESS_RANGE_PACKET = bytes(Command(CommandCode.GET_MEMORY_ADDRESS_RANGE))
+_SELF_VERIFY_PACKET = bytes(Command(CommandCode.SELF_VERIFY))
+_RESET_DEVICE_PACKET = bytes(Command(CommandCode.RESET_DEVICE))
+_RESPONSE_TYPE_MAP: dict[CommandCode, type[ResponseBase]] = {
+    CommandCode.READ_VERSION: Version,
+    CommandCode.READ_FLASH: Response,
+    CommandCode.WRITE_FLASH: Response,
+    CommandCode.ERASE_FLASH: Response,
+    CommandCode.CALC_CHECKSUM: Checksum,
+    CommandCode.RESET_DEVICE: Response,
+    CommandCode.SELF_VERIFY: Response,
+    CommandCode.GET_MEMORY_ADDRESS_RANGE: MemoryRange,
+}
+_BOOTLOADER_EXCEPTIONS: dict[ResponseCode, type[BootloaderError]] = {
+    ResponseCode.UNSUPPORTED_COMMAND: UnsupportedCommand,
+    ResponseCode.BAD_ADDRESS: BadAddress,
+    ResponseCode.BAD_LENGTH: BadLength,
+    ResponseCode.VERIFY_FAIL: VerifyFail,
+}
 
 
 def get_boot_attrs(connection: Connection) -> BootAttrs:
@@ -102,10 +107,8 @@ def _read_version(connection: Connection) -> tuple[int, int, int, int, int]:
         Write block size. When writing to flash, the number of bytes to be
         written must align with a write block.
     """
-    read_version_response = _send_and_receive(
-        connection,
-        Command(CommandCode.READ_VERSION),
-    )
+    _send(connection, _READ_VERSION_PACKET)
+    read_version_response = _get_response(connection, CommandCode.READ_VERSION)
 
     assert isinstance(read_version_response, Version)
 
@@ -139,9 +142,10 @@ def _get_memory_address_range(connection: Connection) -> tuple[int, int]:
     The returned tuple is suitable for use in `range`, i.e. the upper bound is not
     part of the writable range.
     """
-    mem_range_response = _send_and_receive(
+    _send(connection, _GET_MEMORY_ADDRESS_RANGE_PACKET)
+    mem_range_response = _get_response(
         connection,
-        Command(CommandCode.GET_MEMORY_ADDRESS_RANGE),
+        CommandCode.GET_MEMORY_ADDRESS_RANGE,
     )
 
     assert isinstance(mem_range_response, MemoryRange)
@@ -216,16 +220,15 @@ def write_flash(connection: Connection, chunk: Chunk) -> None:
         Firmware chunk to write to bootloader.
     """
     _logger.debug(f"Writing {len(chunk.data)} bytes to {chunk.address:#08x}")
-    _send_and_receive(
-        connection,
-        Command(
-            command=CommandCode.WRITE_FLASH,
-            data_length=len(chunk.data),
-            unlock_sequence=_FLASH_UNLOCK_KEY,
-            address=chunk.address,
-        ),
-        chunk.data,
+    # Called once per chunk; pack the header directly rather than via a Command.
+    header = Command.STRUCT.pack(
+        _WRITE_FLASH,
+        len(chunk.data),
+        _FLASH_UNLOCK_KEY,
+        chunk.address,
     )
+    _send(connection, header, chunk.data)
+    _get_response(connection, CommandCode.WRITE_FLASH)
 
 
 def self_verify(connection: Connection) -> None:
@@ -241,7 +244,8 @@ def self_verify(connection: Connection) -> None:
     mcbootflash.VerifyFail
         If no application is detected.
     """
-    _send_and_receive(connection, Command(command=CommandCode.SELF_VERIFY))
+    _send(connection, _SELF_VERIFY_PACKET)
+    _get_response(connection, CommandCode.SELF_VERIFY)
 
 
 def checksum(
@@ -284,26 +288,20 @@ def checksum(
 
 
 def _get_remote_checksum(connection: Connection, address: int, length: int) -> int:
-    checksum_response = _send_and_receive(
-        connection,
-        Command(
-            command=CommandCode.CALC_CHECKSUM,
-            data_length=length,
-            address=address,
-        ),
-    )
+    header = Command.STRUCT.pack(_CALC_CHECKSUM, length, 0, address)
+    _send(connection, header)
+    checksum_response = _get_response(connection, CommandCode.CALC_CHECKSUM)
     assert isinstance(checksum_response, Checksum)
     return checksum_response.checksum
 
 
 def _get_local_checksum(data: bytes) -> int:
-    chksum = 0
-    extended_address_width = 4
-
-    for batch in batched(data, extended_address_width):
-        chksum += batch[0] + (batch[1] << 8) + batch[2]
-
-    return chksum & 0xFFFF
+    # Data is laid out as 24-bit instructions padded to 32 bits. The bootloader sums
+    # the low 16-bit word plus the high byte of each instruction, ignoring the phantom
+    # byte. Summing strided slices keeps the loop in C.
+    low = sum(data[::4]) + (sum(data[1::4]) << 8)
+    high = sum(data[2::4])
+    return (low + high) & 0xFFFF
 
 
 def reset(connection: Connection) -> None:
@@ -314,7 +312,8 @@ def reset(connection: Connection) -> None:
     connection : Connection
         Connection to device in bootloader mode.
     """
-    _send_and_receive(connection, Command(command=CommandCode.RESET_DEVICE))
+    _send(connection, _RESET_DEVICE_PACKET)
+    _get_response(connection, CommandCode.RESET_DEVICE)
     _logger.debug("Device reset")
 
 
@@ -322,15 +321,18 @@ def _read_flash() -> None:
     raise NotImplementedError
 
 
-def _get_response(connection: Connection, in_response_to: Command) -> ResponseBase:
+def _get_response(
+    connection: Connection,
+    in_response_to: CommandCode,
+) -> ResponseBase:
     """Get a Response packet.
 
     Parameters
     ----------
     connection : Connection
         Connection to device in bootloader mode.
-    in_response_to: Command
-        The `Command` to which a response is expected.
+    in_response_to: CommandCode
+        Code of the command to which a response is expected.
 
     Returns
     -------
@@ -340,50 +342,45 @@ def _get_response(connection: Connection, in_response_to: Command) -> ResponseBa
     # Can't read the whole response in one go. Its length depends on whether it's an
     # error or not. Start by reading the command echo to determine the response
     # type.
-    response = ResponseBase.from_bytes(connection.read(ResponseBase.get_size()))
-    _logger.debug(f"RX: {_format_debug_bytes(bytes(response))}")
+    echo = connection.read(ResponseBase.get_size())
+    response = ResponseBase.from_bytes(echo)
+    debug = _logger.isEnabledFor(logging.DEBUG)
 
-    if response.command != in_response_to.command:
+    if debug:
+        _logger.debug(f"RX: {_format_debug_bytes(echo)}")
+
+    if response.command != in_response_to:
         msg = "Command code mismatch"
         raise BootloaderError(msg)
 
-    response_type_map: dict[CommandCode, type[ResponseBase]] = {
-        CommandCode.READ_VERSION: Version,
-        CommandCode.READ_FLASH: Response,
-        CommandCode.WRITE_FLASH: Response,
-        CommandCode.ERASE_FLASH: Response,
-        CommandCode.CALC_CHECKSUM: Checksum,
-        CommandCode.RESET_DEVICE: Response,
-        CommandCode.SELF_VERIFY: Response,
-        CommandCode.GET_MEMORY_ADDRESS_RANGE: MemoryRange,
-    }
-    response_type = response_type_map[CommandCode(response.command)]
+    response_type = _RESPONSE_TYPE_MAP[in_response_to]
 
     # READ_VERSION has no 'success' flag.
     if response_type is Version:
-        remainder = connection.read(response_type.get_size() - response.get_size())
-        _logger.debug(f"RX: {_format_debug_bytes(remainder, bytes(response))}")
-        return response_type.from_bytes(bytes(response) + remainder)
+        remainder = connection.read(response_type.get_size() - len(echo))
+
+        if debug:
+            _logger.debug(f"RX: {_format_debug_bytes(remainder, echo)}")
+
+        return response_type.from_bytes(echo + remainder)
 
     success = connection.read(1)
-    _logger.debug(f"RX: {_format_debug_bytes(success, bytes(response))}")
+
+    if debug:
+        _logger.debug(f"RX: {_format_debug_bytes(success, echo)}")
 
     if success[0] != ResponseCode.SUCCESS:
-        bootloader_exceptions: dict[ResponseCode, type[BootloaderError]] = {
-            ResponseCode.UNSUPPORTED_COMMAND: UnsupportedCommand,
-            ResponseCode.BAD_ADDRESS: BadAddress,
-            ResponseCode.BAD_LENGTH: BadLength,
-            ResponseCode.VERIFY_FAIL: VerifyFail,
-        }
-        raise bootloader_exceptions[ResponseCode(success[0])]
+        raise _BOOTLOADER_EXCEPTIONS[ResponseCode(success[0])]
 
-    response = Response.from_bytes(bytes(response) + success)
-    remainder = connection.read(response_type.get_size() - response.get_size())
+    # Keep the raw bytes and parse them once at the end, rather than parsing and
+    # re-serializing the packet after each read.
+    received = echo + success
+    remainder = connection.read(response_type.get_size() - len(received))
 
-    if remainder:
-        _logger.debug(f"RX: {_format_debug_bytes(remainder, bytes(response))}")
+    if debug and remainder:
+        _logger.debug(f"RX: {_format_debug_bytes(remainder, received)}")
 
-    return response_type.from_bytes(bytes(response) + remainder)
+    return response_type.from_bytes(received + remainder)
 
 
 def _send_and_receive(
@@ -391,11 +388,30 @@ def _send_and_receive(
     command: Command,
     data: bytes = b"",
 ) -> ResponseBase:
-    msg = f"TX: {_format_debug_bytes(bytes(command))}"
-    msg += f" plus {len(data)} data bytes" if data else ""
-    _logger.debug(msg)
-    connection.write(bytes(command) + data)
-    return _get_response(connection, command)
+    _send(connection, bytes(command), data)
+    return _get_response(connection, command.command)
+
+
+def _send(connection: Connection, header: bytes, data: bytes = b"") -> None:
+    """Send a Command packet, plus any associated data, without waiting for a response.
+
+    Parameters
+    ----------
+    connection : Connection
+        Connection to device in bootloader mode.
+    header : bytes
+        A serialized `Command` packet.
+    data : bytes, optional
+        Data following the command, e.g. the payload of a `WRITE_FLASH` command.
+    """
+    if _logger.isEnabledFor(logging.DEBUG):
+        msg = f"TX: {_format_debug_bytes(header)}"
+        msg += f" plus {len(data)} data bytes" if data else ""
+        _logger.debug(msg)
+
+    # Header and data in a single write, so they go out in as few USB frames as
+    # possible.
+    connection.write(header + data)
 
 
 def _format_debug_bytes(debug_bytes: bytes, pad: bytes = b"") -> str:
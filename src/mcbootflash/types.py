@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import enum
 import struct
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from typing import TYPE_CHECKING, ClassVar, Protocol
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -62,6 +62,9 @@ class Packet:
         Address at which to perform command.
     FORMAT : ClassVar[str]
         Format string for `struct` which specifies types and layout of the data fields.
+    STRUCT : ClassVar[struct.Struct]
+        Compiled form of `FORMAT`. Subclasses which extend `FORMAT` get their own
+        `STRUCT` automatically.
 
     Note
     ----
@@ -77,23 +80,29 @@ class Packet:
     unlock_sequence: int = 0
     address: int = 0
     FORMAT: ClassVar[str] = "=BH2I"
+    STRUCT: ClassVar[struct.Struct] = struct.Struct(FORMAT)
+
+    def __init_subclass__(cls) -> None:  # noqa: D105
+        # Compile the format string once per class rather than on every pack/unpack.
+        cls.STRUCT = struct.Struct(cls.FORMAT)
 
     def __bytes__(self) -> bytes:  # noqa: D105
-        return struct.pack(self.FORMAT, *list(asdict(self).values()))
+        # Unlike `asdict`, this does not deep-copy each field into a new dict.
+        return self.STRUCT.pack(*[getattr(self, field.name) for field in fields(self)])
 
     @classmethod
     def from_bytes(cls: type[Self], data: bytes) -> Self:
         """Create a Packet instance from a bytes-like object."""
         try:
-            return cls(*struct.unpack(cls.FORMAT, data))
+            return cls(*cls.STRUCT.unpack(data))
         except struct.error as exc:
-            msg = f"{cls} expected {struct.calcsize(cls.FORMAT)} bytes, got {len(data)}"
+            msg = f"{cls} expected {cls.STRUCT.size} bytes, got {len(data)}"
             raise struct.error(msg) from exc
 
     @classmethod
     def get_size(cls: type[Self]) -> int:
         """Get the size of Packet in bytes."""
-        return struct.calcsize(cls.FORMAT)
+        return cls.STRUCT.size
 
 
 @dataclass
@@ -47,6 +47,6 @@ def chunked(
         msg = "HEX file contains no data within program memory range"
         raise ValueError(msg)
 
-    total_bytes += (bootattrs.write_size - total_bytes) % bootattrs.write_size
+    total_bytes += -total_bytes % bootattrs.write_size
     align = bootattrs.write_size // hexdata.word_size_bytes
     return total_bytes, hexdata.segments.chunks(chunk_size, align, b"\xff\xff")
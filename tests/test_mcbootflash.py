@@ -173,6 +173,11 @@ def test_format_debug_bytes():
     assert formatted_tx + "\n" + formatted_rx == expected
 
 
+def test_get_local_checksum():
+    data = bytes([0x01, 0x02, 0x03, 0xFF] * 2 + [0xFF, 0xFF, 0xFF, 0xFF] * 300)
+    assert mcbootflash.flash._get_local_checksum(data) == 0x2DB0
+
+
 def test_checksum_bad_address_warning(reserial, caplog, connection):
     boot_attrs = bf.get_boot_attrs(connection)
     payload_size = 240